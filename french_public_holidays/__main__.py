@@ -5,7 +5,10 @@ except ImportError:
 
 def main():
     fph = FrenchPublicHolidays()
-    french_public_holidays = fph.get_french_public_holidays()
-    fph.save_french_public_holidays(french_public_holidays)
+    try:
+        french_public_holidays = fph.get_french_public_holidays()
+        fph.save_french_public_holidays(french_public_holidays)
+    finally:
+        fph.close()
 
 main()
\ No newline at end of file
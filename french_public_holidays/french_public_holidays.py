@@ -1,8 +1,16 @@
 #!/usr/bin/python3
 # -*- coding: utf-8 -*-
 
+import concurrent.futures
 import datetime
+import functools
+import hashlib
 import httpx
+import json
+import os
+import pathlib
+import platformdirs
+import time
 
 try:
     from .config_manager import ConfigurationManager
@@ -15,6 +23,23 @@ except ImportError:
     from output import Output
     from settings import Settings
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+_CACHE_DIR = pathlib.Path(platformdirs.user_cache_dir("french_public_holidays"))
+
+def _atomic_write(path, content):
+    """Write content to path through a temporary file so readers never see a partial file."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(content)
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
+
 class FrenchPublicHolidays:
     """
     FrenchPublicHolidays is a class that manages the retrieval and storage of French public holidays.
@@ -32,8 +57,11 @@ class FrenchPublicHolidays:
             Returns a dictionary containing the configuration data.
         get_french_public_holidays():
             Returns a list of dictionaries containing public holiday data for each year in the specified range.
+            The years are fetched concurrently.
         get_public_holidays(url, years):
             Returns the HTTP response object containing the public holidays data.
+        close():
+            Closes the underlying HTTP client.
         save_french_public_holidays(french_public_holidays):
             Returns None.
         set_zone(url, zone):
@@ -44,8 +72,28 @@ class FrenchPublicHolidays:
         self._settings = settings
         self._config = ConfigurationManager(kwargs)
         self.args = self._get_args().get("french_public_holidays")
+        self._year = int(self.args["year"])
+        self._duration = int(self.args["duration"])
         self.french_public_holidays: list = []
         self.url = self._settings.URL.format(self.args.get("zone"), "{0}")
+        self._url_prefix, self._url_suffix = self._settings.URL.format(self.args.get("zone"), "\0").split("\0")
+        self._client = httpx.Client(http2=True, limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30))
+        self._holidays_for_year = functools.lru_cache(maxsize=32)(self._load_holidays_for_year)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes the underlying HTTP client and releases its pooled connections.
+
+        Returns:
+            None
+        """
+        self._client.close()
 
     def _get_args(self):
         """
@@ -57,6 +105,7 @@ class FrenchPublicHolidays:
         Returns:
             dict: A dictionary containing the configuration data.
         """
+        today_year = datetime.date.today().year
         self._config.add_argument("--duration", "-d", help="Duration in years")
         self._config.add_argument("--output", "-o", help="Output file")
         self._config.add_argument("--year", "-y", help="Starting year")
@@ -66,7 +115,7 @@ class FrenchPublicHolidays:
         self._config.load_config_file(args.config)
         self._config.set_config(section="french_public_holidays", key="duration", env_key="FRENCH_PUBLIC_HOLIDAYS_DURATION", default=1)
         self._config.set_config(section="french_public_holidays", key="output", env_key="FRENCH_PUBLIC_HOLIDAYS_OUTPUT", default="french_public_holidays.csv")
-        self._config.set_config(section="french_public_holidays", key="year", env_key="FRENCH_PUBLIC_HOLIDAYS_YEAR", default=datetime.date.today().year)
+        self._config.set_config(section="french_public_holidays", key="year", env_key="FRENCH_PUBLIC_HOLIDAYS_YEAR", default=today_year)
         self._config.set_config(section="french_public_holidays", key="zone", env_key="FRENCH_PUBLIC_HOLIDAYS_ZONE", default="metropole")
         self.validate(self._config.config_data.get("french_public_holidays"))
 
@@ -77,17 +126,106 @@ class FrenchPublicHolidays:
         Retrieves French public holidays for a specified range of years.
 
         This method fetches public holidays for a given zone and duration starting from a specified year.
-        The holidays are retrieved from an external API and stored in a list.
+        The holidays are retrieved from an external API and stored in a list. Years are loaded
+        concurrently in worker threads sharing the same HTTP client.
 
         Returns:
             list: A list of dictionaries containing public holiday data for each year in the specified range.
         """
 
-        self.french_public_holidays: list = []
-        for year in range(int(self.args.get("year")), int(self.args.get("year")) + int(self.args.get("duration"))):
-            self.french_public_holidays.append(self.get_public_holidays(year).json())
+        years = range(self._year, self._year + self._duration)
+        with concurrent.futures.ThreadPoolExecutor() as pool:
+            # Copy the memoized dictionaries so callers can't alter later lookups.
+            self.french_public_holidays = [dict(holidays) for holidays in pool.map(self._holidays_for_year, years)]
         return self.french_public_holidays
 
+    def _year_url(self, year):
+        return f"{self._url_prefix}{year}{self._url_suffix}"
+
+    def _cached_response(self, year, content):
+        """
+        Wraps a cached body in an HTTP response, so cached and fetched years look the same to callers.
+
+        Args:
+            year (int): The year of the public holidays.
+            content (bytes): The cached JSON body.
+
+        Returns:
+            Response: A 200 HTTP response object carrying the cached body.
+        """
+        return httpx.Response(200, content=content, request=httpx.Request("GET", self._year_url(year)))
+
+    def _cache_path(self, year):
+        url_hash = hashlib.sha256(self._year_url(year).encode("utf-8")).hexdigest()[:16]
+        return _CACHE_DIR / f"{self.args.get('zone')}_{year}_{url_hash}.json"
+
+    def _read_cache(self, year):
+        """
+        Reads the cached public holidays for the specified year.
+
+        Past years never change and are always served from the cache. The current and
+        future years are only served if the cached file is younger than CACHE_MAX_AGE.
+
+        Args:
+            year (int): The year for which to read the public holidays.
+
+        Returns:
+            Response: The cached response, or None if there is no usable cache entry.
+        """
+        path = self._cache_path(year)
+        try:
+            if int(year) >= datetime.date.today().year and time.time() - path.stat().st_mtime > self._settings.CACHE_MAX_AGE:
+                return None
+            return self._cached_response(year, path.read_bytes())
+        except OSError:
+            return None
+
+    def _conditional_headers(self, year):
+        """
+        Builds the conditional request headers for a year that already has a cached body.
+
+        Args:
+            year (int): The year for which to build the headers.
+
+        Returns:
+            dict: The If-None-Match / If-Modified-Since headers, empty if nothing is cached.
+        """
+        path = self._cache_path(year)
+        try:
+            if not path.exists():
+                return {}
+            meta = json.loads(path.with_suffix(".meta.json").read_bytes())
+        except (OSError, ValueError):
+            return {}
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def _write_cache(self, year, response):
+        """
+        Atomically writes a successful response body and its ETag / Last-Modified metadata to the cache.
+
+        Args:
+            year (int): The year of the public holidays.
+            response (Response): The HTTP response object to cache.
+
+        Returns:
+            None
+        """
+        if response.status_code != 200:
+            return
+        path = self._cache_path(year)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            meta = {"etag": response.headers.get("ETag"), "last_modified": response.headers.get("Last-Modified")}
+            _atomic_write(path, response.content)
+            _atomic_write(path.with_suffix(".meta.json"), json.dumps(meta).encode("utf-8"))
+        except OSError:
+            pass
+
     def get_public_holidays(self, years):
         """
         Fetches public holidays for the specified years from the given URL.
@@ -96,9 +234,24 @@ class FrenchPublicHolidays:
             years (int): The year for which to fetch the public holidays.
 
         Returns:
-            Response: The HTTP response object containing the public holidays data.
+            Response: The HTTP response object containing the public holidays data, served from the
+            on-disk cache when the year is available there.
         """
-        return httpx.get(self.url.format(years))
+        cached = self._read_cache(years)
+        if cached is not None:
+            return cached
+        url = self._year_url(years)
+        response = self._client.get(url, headers=self._conditional_headers(years))
+        if response.status_code == 304:
+            # Not modified: refresh the cached body, or fetch it again if it vanished meanwhile.
+            path = self._cache_path(years)
+            try:
+                os.utime(path)
+                return self._cached_response(years, path.read_bytes())
+            except OSError:
+                response = self._client.get(url)
+        self._write_cache(years, response)
+        return response
 
     def get_public_holiday(self, date):
         """
@@ -111,10 +264,29 @@ class FrenchPublicHolidays:
         Returns:
             str: The description of the public holiday.
         """
-        day = datetime.datetime.strptime(date, "%Y-%m-%d")
-        year = day.year
-        public_holidays = self.get_public_holidays(year).json()
-        return public_holidays.get(day.strftime("%Y-%m-%d"))
+        try:
+            day = datetime.date.fromisoformat(date)
+        except ValueError:
+            day = datetime.datetime.strptime(date, "%Y-%m-%d").date()
+        return self._holidays_for_year(day.year).get(day.isoformat())
+
+    def _load_holidays_for_year(self, year):
+        """
+        Loads the public holidays of the specified year for the current zone.
+
+        This method is memoized per instance as _holidays_for_year, so repeated lookups
+        within the same year only hit the API (or the on-disk cache) once. The memo lasts for
+        the lifetime of the instance (or until set_zone is called): unlike the on-disk cache,
+        it does not expire after CACHE_MAX_AGE. The returned dictionary is shared and must
+        not be modified.
+
+        Args:
+            year (int): The year for which to load the public holidays.
+
+        Returns:
+            dict: A dictionary mapping dates ('%Y-%m-%d') to holiday descriptions.
+        """
+        return _json_loads(self.get_public_holidays(year).content)
 
     def is_public_holiday(self, date):
         """
@@ -152,9 +324,10 @@ class FrenchPublicHolidays:
             YearInThePastException: If the year is more than 20 years in the past.
             YearInTheFutureException: If the year is more than 5 years in the future.
         """
-        if datetime.date.today().year - int(args.get("year")) > 20:
+        today_year = datetime.date.today().year
+        if today_year - int(args.get("year")) > 20:
             raise YearInThePastException("The year cannot exceed 20 years in the past.")
-        elif datetime.date.today().year + 5 < int(args.get("year")) + int(args.get("duration")):
+        elif today_year + 5 < int(args.get("year")) + int(args.get("duration")):
             raise YearInTheFutureException("The year cannot exceed 5 years in the future.")
 
     def get_duration(self):
@@ -171,13 +344,17 @@ class FrenchPublicHolidays:
 
     def set_duration(self, duration):
         self.args["duration"] = duration
+        self._duration = int(duration)
 
     def set_output(self, output):
         self.args["output"] = output
 
     def set_year(self, year):
         self.args["year"] = year
+        self._year = int(year)
 
     def set_zone(self, zone):
         self.args["zone"] = zone
-        self.url = self._settings.URL.format(zone, "{0}")
\ No newline at end of file
+        self.url = self._settings.URL.format(zone, "{0}")
+        self._url_prefix, self._url_suffix = self._settings.URL.format(zone, "\0").split("\0")
+        self._holidays_for_year.cache_clear()
\ No newline at end of file
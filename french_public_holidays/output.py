@@ -1,8 +1,28 @@
-import csv
-import datetime
-import json
 import os
-import yaml
+
+def _json_dumps(obj):
+    """Serialize obj to indented UTF-8 JSON bytes, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+def _yaml_dumper():
+    """Return PyYAML's C-backed safe dumper, or the pure-Python one if libyaml is unavailable."""
+    import yaml
+    return getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+def _format_date(date):
+    """Convert a 'YYYY-MM-DD' date string to 'dd/mm/yy' by slicing."""
+    return f"{date[8:10]}/{date[5:7]}/{date[2:4]}"
+
+def _iter_rows(data):
+    """Yield (date, description) tuples with dates formatted as 'dd/mm/yy'."""
+    for jf in data:
+        for date, description in jf.items():
+            yield _format_date(date), description
 
 class Output:
     """
@@ -31,6 +51,24 @@ class Output:
         self.header = header
         self.output = output
         self.extension = os.path.splitext(output)[1][1:] or None
+        self._dispatch = {
+            "csv": self.save_csv,
+            "json": self.save_json,
+            "yaml": self.save_yaml,
+            "yml": self.save_yaml,
+        }
+
+    def _rows(self, data):
+        """
+        Flatten the provided data into a list of rows with formatted dates.
+
+        Args:
+            data (list): A list of dictionaries mapping '%Y-%m-%d' date strings to descriptions.
+
+        Returns:
+            list: A list of dictionaries with a 'date' key formatted as 'dd/mm/yy' and a 'description' key.
+        """
+        return [{"date": date, "description": description} for date, description in _iter_rows(data)]
 
     def save(self, data):
         """
@@ -48,16 +86,10 @@ class Output:
             - yaml: Saves data in YAML format.
             - yml: Saves data in YAML format.
         """
-        if self.extension == "csv":
-            self.save_csv(data)
-        elif self.extension == "json":
-            self.save_json(data)
-        elif self.extension == "yaml":
-            self.save_yaml(data)
-        elif self.extension == "yml":
-            self.save_yaml(data)
-        else:
+        save = self._dispatch.get(self.extension)
+        if save is None:
             raise ValueError("Extension not supported")
+        save(data)
 
     def save_csv(self, data):
         """
@@ -72,13 +104,12 @@ class Output:
             a header row followed by rows of data. Dates in the data will be formatted
             as 'dd/mm/yy'.
         """
-        with open(self.output, 'w', newline='', encoding='utf-8') as csvfile:
+        import csv
+
+        with open(self.output, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
             writer = csv.writer(csvfile, delimiter=",")
             writer.writerow(self.header)
-            for jf in data:
-                for j in jf:
-                    date = datetime.datetime.strptime(j, '%Y-%m-%d').strftime('%d/%m/%y')
-                    writer.writerow([date, jf[j]])
+            writer.writerows(_iter_rows(data))
 
     def save_json(self, data):
         """
@@ -97,12 +128,8 @@ class Output:
             where each dictionary has a 'date' key with the date formatted as 'dd/mm/yy' and a 'description' key
             with the description of the public holiday.
         """
-        with_headers = []
-        for jf in data:
-            for j in jf:
-                with_headers.append({"date": datetime.datetime.strptime(j, '%Y-%m-%d').strftime('%d/%m/%y'), "description": jf[j]})
-        with open(self.output, 'w', encoding='utf-8') as jsonfile:
-            json.dump(with_headers, jsonfile, indent=4)
+        with open(self.output, 'wb') as jsonfile:
+            jsonfile.write(_json_dumps(self._rows(data)))
 
     def save_yaml(self, data):
         """
@@ -117,9 +144,7 @@ class Output:
             where each dictionary has a 'date' key with the date formatted as 'dd/mm/yy' and a 'description' key
             with the description of the public holiday.
         """
-        with_headers = []
-        for jf in data:
-            for j in jf:
-                with_headers.append({"date": datetime.datetime.strptime(j, '%Y-%m-%d').strftime('%d/%m/%y'), "description": jf[j]})
+        import yaml
+
         with open(self.output, 'w', encoding='utf-8') as yamlfile:
-            yaml.dump(with_headers, yamlfile, default_flow_style=False)
\ No newline at end of file
+            yaml.dump(self._rows(data), yamlfile, default_flow_style=False, Dumper=_yaml_dumper())
\ No newline at end of file
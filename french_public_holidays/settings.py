@@ -7,6 +7,8 @@ class Settings(BaseSettings):
     Attributes:
         HEADERS (list): A list of headers for the data, default is ["date", "description"].
         URL (str): The URL template for fetching public holidays data, default is "https://calendrier.api.gouv.fr/jours-feries/{0}/{1}.json".
+        CACHE_MAX_AGE (int): Maximum age in seconds of cached data for the current and future years, default is 86400.
     """
     HEADERS: list = ["date", "description"]
-    URL: str = "https://calendrier.api.gouv.fr/jours-feries/{0}/{1}.json"
\ No newline at end of file
+    URL: str = "https://calendrier.api.gouv.fr/jours-feries/{0}/{1}.json"
+    CACHE_MAX_AGE: int = 86400
\ No newline at end of file
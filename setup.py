@@ -25,7 +25,8 @@ setup(
     include_package_data=True,
     install_requires=[
         'configparser',
-        'httpx',
+        'httpx[http2]',
+        'platformdirs',
         'pydantic',
         'python-dotenv',
         'PyYAML'